@@ -0,0 +1,106 @@
+"""Benchmark full versus sparse (``fields=``) patient list responses.
+
+Seeds a throwaway SQLite database with patients carrying a large
+``medical_history`` and compares the list query with and without a
+``load_only`` projection, reporting time per page and bytes on the wire.
+
+Run from the project root::
+
+    poetry run python benchmarks/bench_patient_fields.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+_db_file = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_file}"
+
+from pydantic import BaseModel, TypeAdapter  # noqa: E402
+from sqlalchemy.orm import Session, load_only  # noqa: E402
+
+from db.database import Base, SessionLocal, engine  # noqa: E402
+from models.patients import Patient  # noqa: E402
+from routers.patients import parse_fields, to_summary  # noqa: E402
+from schemas.patients import PatientResponse, PatientSummary  # noqa: E402
+
+PATIENTS = 5000
+PAGE_SIZE = 100
+ROUNDS = 50
+HISTORY_SIZE = 4000
+LIST_FIELDS = "first_name,last_name"
+
+
+def seed(db: Session) -> None:
+    """Insert benchmark patients with a large medical history each."""
+    db.add_all(
+        Patient(
+            first_name=f"First{i}",
+            last_name=f"Last{i}",
+            date_of_birth="1980-01-01",
+            gender="female" if i % 2 else "male",
+            address=f"{i} Main Street",
+            phone_number=f"555-{i:04d}",
+            email=f"patient{i}@example.com",
+            medical_history="x" * HISTORY_SIZE,
+        )
+        for i in range(PATIENTS)
+    )
+    db.commit()
+
+
+def full_page(db: Session, skip: int) -> List[BaseModel]:
+    """Load a page the way ``GET /patients/`` does without ``fields=``."""
+    patients = db.query(Patient).offset(skip).limit(PAGE_SIZE).all()
+    return [PatientResponse.model_validate(p, from_attributes=True) for p in patients]
+
+
+def sparse_page(db: Session, skip: int) -> List[BaseModel]:
+    """Load a page the way ``GET /patients/?fields=...`` does."""
+    selected = parse_fields(LIST_FIELDS) or []
+    patients = (
+        db.query(Patient)
+        .options(load_only(*(getattr(Patient, f) for f in selected)))
+        .offset(skip)
+        .limit(PAGE_SIZE)
+        .all()
+    )
+    return [to_summary(p, selected) for p in patients]
+
+
+def run(name: str, load: Callable[[Session, int], List[BaseModel]]) -> None:
+    """Time ``ROUNDS`` page loads and report the serialized page size."""
+    adapter = TypeAdapter(List[PatientResponse] | List[PatientSummary])
+    elapsed = 0.0
+    size = 0
+    for i in range(ROUNDS):
+        skip = (i * PAGE_SIZE) % PATIENTS
+        with SessionLocal() as db:
+            start = time.perf_counter()
+            page = load(db, skip)
+            body = adapter.dump_json(page, exclude_unset=True)
+            elapsed += time.perf_counter() - start
+        size = len(body)
+    print(f"{name:<8} {elapsed / ROUNDS * 1000:8.2f} ms/page {size:10d} bytes/page")
+
+
+def main() -> None:
+    """Seed the database and compare full and sparse list pages."""
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        seed(db)
+    print(f"{PATIENTS} patients, {PAGE_SIZE} per page, {ROUNDS} rounds")
+    run("full", full_page)
+    run("sparse", sparse_page)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,9 @@ function PatientsPage() {
         if (!token) {
           console.warn('No token found in localStorage!');
         }
-        const response = await api.get('/patients/');
+        const response = await api.get('/patients/', {
+          params: { fields: 'first_name,last_name,date_of_birth,gender,email,phone_number' }
+        });
         setPatients(response.data);
       } catch (err) {
         console.error('Error fetching patients:', err);
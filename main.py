@@ -1,6 +1,7 @@
 """FastAPI application entry point."""
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
@@ -8,6 +9,8 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from db.database import Base, engine
 from routers import auth, patients
+from services.patient_stats_service import refresh_patient_stats_daily
+from services.patient_stats_service import rebuild_patient_stats_in_new_session
 
 
 @asynccontextmanager
@@ -15,9 +18,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan context manager for FastAPI app startup and shutdown."""
     # Startup
     Base.metadata.create_all(bind=engine)
+    rebuild_patient_stats_in_new_session()
+    stats_refresh = asyncio.create_task(refresh_patient_stats_daily())
     yield
     # Shutdown
-    pass
+    stats_refresh.cancel()
+    with suppress(asyncio.CancelledError):
+        await stats_refresh
 
 
 app = FastAPI(lifespan=lifespan)
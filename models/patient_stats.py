@@ -0,0 +1,23 @@
+"""SQLAlchemy model for the patient statistics summary table."""
+
+from sqlalchemy import Boolean, Column, Integer, String
+
+from db.database import Base
+
+
+class PatientStat(Base):
+    """Pre-aggregated patient counts keyed by gender, status and age band.
+
+    Rows are kept in step with ``patients`` by the create/update/delete
+    endpoints and fully recomputed once a day so age bands follow
+    birthdays. The key space is genders x 2 x age bands, independent of
+    the number of patients. Empty strings stand in for an unknown gender,
+    so the composite primary key never contains NULLs.
+    """
+
+    __tablename__ = "patient_stats"
+
+    gender = Column(String, primary_key=True)
+    is_active = Column(Boolean, primary_key=True)
+    age_band = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -3,21 +3,54 @@
 import logging
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from db.database import get_db
 from models.patients import Patient
 from models.users import User
-from schemas.patients import PatientCreate, PatientResponse
+from schemas.patients import PatientCreate, PatientResponse, PatientStatsResponse
+from schemas.patients import PatientSummary
 from services.auth_service import get_current_user
+from services.patient_stats_service import adjust_patient_stats, get_patient_stats
+from services.patient_stats_service import patient_stat_key, rebuild_patient_stats
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/patients", tags=["patients"])
 
+FIELDS_DESCRIPTION = (
+    "Comma-separated list of fields to return, e.g. `first_name,last_name`. "
+    "Only these columns are loaded from the database; `id` is always included."
+)
+
+
+def parse_fields(fields: str | None) -> list[str] | None:
+    """Validate a ``fields=`` parameter and return the requested field names."""
+    if fields is None:
+        return None
+
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    if not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No fields requested",
+        )
+    unknown = [f for f in requested if f not in PatientSummary.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+    return ["id"] + [f for f in dict.fromkeys(requested) if f != "id"]
+
+
+def to_summary(patient: Patient, fields: list[str]) -> PatientSummary:
+    """Build a sparse response holding only the requested, already loaded fields."""
+    return PatientSummary(**{f: getattr(patient, f) for f in fields})
+
 
 @router.post(
     "/",
@@ -47,6 +80,8 @@ def create_patient(
 
         db_patient = Patient(**patient.model_dump())
         db.add(db_patient)
+        db.flush()
+        adjust_patient_stats(db, patient_stat_key(db_patient), 1)
         db.commit()
         db.refresh(db_patient)
 
@@ -77,10 +112,83 @@ def create_patient(
         )
 
 
+@router.get(
+    "/stats",
+    response_model=PatientStatsResponse,
+    responses={500: {"description": "Internal Server Error - Database error"}},
+)
+def get_patients_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> PatientStatsResponse:
+    """Retrieve patient counts by gender, age band and active status."""
+    try:
+        return get_patient_stats(db)
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while retrieving patient statistics",
+        )
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise e
+        logger.error(f"Unexpected error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred",
+        )
+
+
+@router.post(
+    "/stats/rebuild",
+    response_model=PatientStatsResponse,
+    responses={
+        403: {"description": "Forbidden - Only admin users can rebuild statistics"},
+        500: {"description": "Internal Server Error - Database error"},
+    },
+)
+def rebuild_patients_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> PatientStatsResponse:
+    """Recompute patient statistics from scratch and return the result."""
+    try:
+        if current_user.role != "admin":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only admin users can rebuild statistics",
+            )
+
+        rebuild_patient_stats(db)
+        db.commit()
+        return get_patient_stats(db)
+
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Database error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while rebuilding patient statistics",
+        )
+    except Exception as e:
+        db.rollback()
+        if isinstance(e, HTTPException):
+            raise e
+        logger.error(f"Unexpected error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred",
+        )
+
+
 @router.get(
     "/{patient_id}",
-    response_model=PatientResponse,
+    response_model=PatientResponse | PatientSummary,
+    response_model_exclude_unset=True,
     responses={
+        400: {"description": "Bad Request - Unknown field requested"},
         403: {"description": ("Forbidden - User doesn't have access to this patient")},
         404: {"description": "Not Found - Patient not found"},
         500: {"description": "Internal Server Error - Database error"},
@@ -88,18 +196,25 @@ def create_patient(
 )
 def get_patient(
     patient_id: int,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> PatientResponse:
-    """Retrieve a patient by ID."""
+) -> PatientResponse | PatientSummary:
+    """Retrieve a patient by ID, optionally restricted to selected fields."""
     try:
-        patient = db.query(Patient).filter(Patient.id == patient_id).first()
+        selected = parse_fields(fields)
+        query = db.query(Patient).filter(Patient.id == patient_id)
+        if selected:
+            query = query.options(load_only(*(getattr(Patient, f) for f in selected)))
+        patient = query.first()
         if not patient:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Patient not found",
             )
 
+        if selected:
+            return to_summary(patient, selected)
         return PatientResponse.model_validate(patient, from_attributes=True)
 
     except SQLAlchemyError as e:
@@ -120,18 +235,29 @@ def get_patient(
 
 @router.get(
     "/",
-    response_model=List[PatientResponse],
-    responses={500: {"description": "Internal Server Error - Database error"}},
+    response_model=List[PatientResponse] | List[PatientSummary],
+    response_model_exclude_unset=True,
+    responses={
+        400: {"description": "Bad Request - Unknown field requested"},
+        500: {"description": "Internal Server Error - Database error"},
+    },
 )
 def get_patients(
     skip: int = 0,
     limit: int = 100,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> List[PatientResponse]:
-    """Retrieve a list of patients."""
+) -> List[PatientResponse] | List[PatientSummary]:
+    """Retrieve a list of patients, optionally restricted to selected fields."""
     try:
-        patients = db.query(Patient).offset(skip).limit(limit).all()
+        selected = parse_fields(fields)
+        query = db.query(Patient)
+        if selected:
+            query = query.options(load_only(*(getattr(Patient, f) for f in selected)))
+        patients = query.offset(skip).limit(limit).all()
+        if selected:
+            return [to_summary(p, selected) for p in patients]
         return [
             PatientResponse.model_validate(p, from_attributes=True) for p in patients
         ]
@@ -188,11 +314,18 @@ def update_patient(
                     detail="Email already registered",
                 )
 
+        old_stat_key = patient_stat_key(db_patient)
         mutable_fields = ["name", "email", "phone"]  # Define fields that can be updated
         for key, value in patient.model_dump().items():
             if key in mutable_fields:
                 setattr(db_patient, key, value)
 
+        # Only changes once gender, date_of_birth or is_active become mutable.
+        new_stat_key = patient_stat_key(db_patient)
+        if new_stat_key != old_stat_key:
+            adjust_patient_stats(db, old_stat_key, -1)
+            adjust_patient_stats(db, new_stat_key, 1)
+
         db.commit()
         db.refresh(db_patient)
         return PatientResponse.model_validate(db_patient, from_attributes=True)
@@ -244,6 +377,7 @@ def delete_patient(
                 detail="Patient not found",
             )
 
+        adjust_patient_stats(db, patient_stat_key(db_patient), -1)
         db.delete(db_patient)
         db.commit()
 
@@ -32,3 +32,33 @@ class PatientResponse(PatientBase):
         """Pydantic configuration for ORM mode."""
 
         from_attributes = True
+
+
+class PatientSummary(BaseModel):
+    """Schema for a sparse patient projection selected with ``fields=``.
+
+    Mirrors the columns of ``models.patients.Patient`` as optionals; keep it in
+    step with that model and ``PatientResponse``. Built from a dict of loaded
+    columns only, since reading unloaded attributes would hit the database.
+    """
+
+    id: int
+    first_name: str | None = None
+    last_name: str | None = None
+    date_of_birth: str | None = None
+    gender: str | None = None
+    address: str | None = None
+    phone_number: str | None = None
+    email: EmailStr | None = None
+    medical_history: str | None = None
+    is_active: bool | None = None
+
+
+class PatientStatsResponse(BaseModel):
+    """Schema for aggregated patient statistics."""
+
+    total: int
+    active: int
+    inactive: int
+    by_gender: dict[str, int]
+    by_age_band: dict[str, int]
@@ -0,0 +1,209 @@
+"""Incrementally maintained patient statistics."""
+
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+from sqlalchemy import func, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from db.database import SessionLocal
+from models.patient_stats import PatientStat
+from models.patients import Patient
+from schemas.patients import PatientStatsResponse
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN = "unknown"
+
+# (label, minimum age, maximum age or None for open-ended)
+AGE_BANDS = [
+    ("0-17", 0, 17),
+    ("18-34", 18, 34),
+    ("35-49", 35, 49),
+    ("50-64", 50, 64),
+    ("65+", 65, None),
+]
+
+StatKey = tuple[str, bool, str]
+
+
+def _age_band(date_of_birth: str | None, today: date) -> str:
+    """Map an ISO date of birth to the patient's age band on ``today``."""
+    try:
+        born = date.fromisoformat(str(date_of_birth)[:10])
+    except ValueError:
+        return UNKNOWN
+    age = today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+    for label, low, high in AGE_BANDS:
+        if age >= low and (high is None or age <= high):
+            return label
+    return UNKNOWN
+
+
+def _stat_key(
+    gender: str | None,
+    is_active: bool | None,
+    date_of_birth: str | None,
+    today: date,
+) -> StatKey:
+    """Build the summary table key for a patient's attributes."""
+    return (
+        gender or "",
+        True if is_active is None else bool(is_active),
+        _age_band(date_of_birth, today),
+    )
+
+
+def patient_stat_key(patient: Patient) -> StatKey:
+    """Return the summary table key a patient row is counted under today."""
+    return _stat_key(
+        patient.gender, patient.is_active, patient.date_of_birth, date.today()
+    )
+
+
+def adjust_patient_stats(db: Session, key: StatKey, delta: int) -> None:
+    """Add ``delta`` to the counter for ``key`` within the current transaction.
+
+    PostgreSQL and SQLite use a native upsert; other backends fall back to
+    an UPDATE followed by an INSERT when no row matched. The caller is
+    responsible for committing, so the summary changes atomically with the
+    patient row it describes.
+    """
+    gender, is_active, age_band = key
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(PatientStat).values(
+            gender=gender, is_active=is_active, age_band=age_band, count=delta
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                PatientStat.gender,
+                PatientStat.is_active,
+                PatientStat.age_band,
+            ],
+            set_={"count": PatientStat.count + delta},
+        )
+        db.execute(stmt)
+    else:
+        updated = (
+            db.query(PatientStat)
+            .filter(
+                PatientStat.gender == gender,
+                PatientStat.is_active == is_active,
+                PatientStat.age_band == age_band,
+            )
+            .update(
+                {PatientStat.count: PatientStat.count + delta},
+                synchronize_session=False,
+            )
+        )
+        if not updated:
+            db.add(
+                PatientStat(
+                    gender=gender, is_active=is_active, age_band=age_band, count=delta
+                )
+            )
+            db.flush()
+    if delta < 0:
+        db.query(PatientStat).filter(
+            PatientStat.gender == gender,
+            PatientStat.is_active == is_active,
+            PatientStat.age_band == age_band,
+            PatientStat.count <= 0,
+        ).delete(synchronize_session=False)
+
+
+def rebuild_patient_stats(db: Session) -> None:
+    """Recompute the summary table from scratch with a GROUP BY over patients.
+
+    Used as a consistency check, to seed the table for existing data and
+    daily so age bands follow birthdays. This scans ``patients`` and is the
+    only statistics path whose cost grows with the number of patients.
+    On PostgreSQL the summary table is locked first so concurrent
+    create/update/delete upserts wait for the rebuild instead of being
+    overwritten by it; SQLite already serializes writers for the whole
+    transaction. The caller is responsible for committing, which releases
+    the lock.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("LOCK TABLE patient_stats IN EXCLUSIVE MODE"))
+    rows = (
+        db.query(
+            Patient.gender,
+            Patient.date_of_birth,
+            Patient.is_active,
+            func.count(Patient.id),
+        )
+        .group_by(Patient.gender, Patient.date_of_birth, Patient.is_active)
+        .all()
+    )
+    today = date.today()
+    counts: dict[StatKey, int] = defaultdict(int)
+    for gender, date_of_birth, is_active, count in rows:
+        counts[_stat_key(gender, is_active, date_of_birth, today)] += count
+
+    db.query(PatientStat).delete(synchronize_session=False)
+    db.add_all(
+        PatientStat(gender=gender, is_active=is_active, age_band=age_band, count=count)
+        for (gender, is_active, age_band), count in counts.items()
+    )
+    db.flush()
+
+
+def _totals(db: Session, column: Any) -> dict[Any, int]:
+    """Sum summary counts grouped by a single summary column."""
+    rows = db.query(column, func.sum(PatientStat.count)).group_by(column).all()
+    return {key: int(count) for key, count in rows}
+
+
+def get_patient_stats(db: Session) -> PatientStatsResponse:
+    """Read aggregated patient statistics from the summary table.
+
+    Totals are SQL ``GROUP BY`` sums over at most genders x 2 x age bands
+    summary rows, so the cost does not grow with the number of patients.
+    Age bands are exact as long as the table was rebuilt since the last
+    midnight, which the startup rebuild and ``refresh_patient_stats_daily``
+    ensure; incremental updates in between use the same day's bands.
+    """
+    by_status = _totals(db, PatientStat.is_active)
+    by_gender: dict[str, int] = defaultdict(int)
+    for gender, count in _totals(db, PatientStat.gender).items():
+        by_gender[gender or UNKNOWN] += count
+    by_age_band = {label: 0 for label, _, _ in AGE_BANDS}
+    by_age_band[UNKNOWN] = 0
+    by_age_band.update(_totals(db, PatientStat.age_band))
+
+    active = by_status.get(True, 0)
+    inactive = by_status.get(False, 0)
+    return PatientStatsResponse(
+        total=active + inactive,
+        active=active,
+        inactive=inactive,
+        by_gender=dict(by_gender),
+        by_age_band=by_age_band,
+    )
+
+
+async def refresh_patient_stats_daily() -> None:
+    """Rebuild the summary table after every midnight so age bands stay exact."""
+    while True:
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+        await asyncio.sleep((midnight - now).total_seconds())
+        try:
+            await asyncio.to_thread(rebuild_patient_stats_in_new_session)
+        except SQLAlchemyError as e:
+            logger.error(f"Patient statistics refresh failed: {str(e)}")
+
+
+def rebuild_patient_stats_in_new_session() -> None:
+    """Run ``rebuild_patient_stats`` in its own committed session."""
+    with SessionLocal() as db:
+        rebuild_patient_stats(db)
+        db.commit()